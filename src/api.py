@@ -72,6 +72,8 @@ async def generate_script(
     tones: List[str] = Form(["professional"]),
     file_name: Optional[UploadFile] = File(None),
     platform: str = Form(...),
+    index_reference: bool = Form(False),
+    reference_topic: Optional[str] = Form(None),
     _: None = Depends(verify_api_key)
 ):
     base_template_path = "template_scripts/"
@@ -80,7 +82,7 @@ async def generate_script(
         file_path = await save_upload_file(file_name)
 
     async def event_stream():
-        async for event in stream_langgraph_task(topic, tones, file_path, platform):
+        async for event in stream_langgraph_task(topic, tones, file_path, platform, index_reference, reference_topic):
             print(json.dumps(event))
             yield f"data: {json.dumps(event)}\n\n"
 
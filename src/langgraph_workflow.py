@@ -1,3 +1,4 @@
+from datetime import date
 from typing_extensions import TypedDict
 from langgraph.graph import StateGraph, END, START
 from src.nodes.research import research_node
@@ -13,6 +14,7 @@ class WorkflowState(TypedDict):
     file_path: str
     current_year: str
     research_results: str
+    web_results: str  # Raw web search results, indexed for later runs
     final_script: str
     platform: str
     needs_more_research: bool  # New field to control iterative research
@@ -55,8 +57,9 @@ def run_youtube_script_workflow(
         "topic": topic,
         "tones": tones,
         "file_path": file_path,
-        "current_year": current_year or '2025',
+        "current_year": current_year or str(date.today().year),
         "research_results": "",
+        "web_results": "",
         "final_script": "",
         "platform": platform,
         "needs_more_research": False  # Start with no extra research needed
@@ -1,6 +1,7 @@
 from ..utils.prompt_builders import build_prompt, build_task_prompt
-from ..utils.tool_registry import get_tools_for_agent
+from ..utils.tool_registry import get_tools_for_agent, tavily_tool
 from ..utils.config_loader import load_yaml_config
+import json
 from pathlib import Path
 from langchain_openai import ChatOpenAI
 from src.utils.model_constants import AI_MODEL
@@ -8,6 +9,21 @@ from src.utils.model_constants import AI_MODEL
 AGENTS_CONFIG = load_yaml_config('config/agents.yaml')
 TASKS_CONFIG = load_yaml_config('config/tasks.yaml')
 
+def collect_web_results(messages) -> str:
+    """Collect the web search results the agent received, leaving out its own summary."""
+    texts = []
+    for message in messages:
+        if getattr(message, "type", None) != "tool" or getattr(message, "name", None) != tavily_tool.name:
+            continue
+        try:
+            results = json.loads(message.content).get("results", [])
+        except (TypeError, ValueError, AttributeError):
+            texts.append(str(message.content))
+            continue
+        for r in results:
+            texts.append(f"{r.get('title', '')} ({r.get('url', '')})\n{r.get('content', '')}")
+    return "\n\n".join(texts)
+
 def research_node(state):
     """Research node that performs research and updates the state."""
     print("---Research Node---")
@@ -29,6 +45,10 @@ def research_node(state):
     result = researcher_agent.invoke({"messages": [{"role": "user", "content": f"Research the topic: {state['topic']} with tones: {state['tones']}"}]})
     if result and "messages" in result:
         research_results = result["messages"][-1].content if result["messages"] else "No research results"
+        web_results = collect_web_results(result["messages"])
     else:
         research_results = "No research results"
-    return {"research_results": research_results} 
\ No newline at end of file
+        web_results = ""
+    # Accumulate across research rounds so every web result of the run can be indexed
+    web_results = "\n\n".join(r for r in (state.get("web_results", ""), web_results) if r)
+    return {"research_results": research_results, "web_results": web_results} 
\ No newline at end of file
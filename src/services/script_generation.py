@@ -1,13 +1,70 @@
 import asyncio
 import os
-from src.utils.file_utils import create_script_docx
+from typing import Optional
+from src.utils.file_utils import create_script_docx, is_builtin_template
+from src.utils.research_index import research_index
+from src.tools.docx_read_tool_langgraph import docx_read_tool_langgraph
 from src.langgraph_workflow import run_youtube_script_workflow
 
+# Keep references to running indexing tasks so they are not garbage collected
+_indexing_tasks = set()
 
-async def stream_langgraph_task(topic: str, tones: list, file_path: str, platform: str):
+
+def remove_upload(file_path: Optional[str]):
+    """Delete an uploaded reference file, leaving the bundled templates alone."""
+    if file_path and not is_builtin_template(file_path):
+        try:
+            os.remove(file_path)
+        except Exception:
+            # Silently ignore cleanup errors
+            pass
+
+
+def index_run_outputs(topic: str, web_results: str, reference_path: Optional[str] = None, reference_topic: Optional[str] = None):
+    """
+    Incrementally add the web search results of a completed run to the local research index.
+    The researcher's summary is not indexed, since it may paraphrase older indexed chunks
+    that would then come back with a fresh date.
+    If a reference script path is given, its text is indexed too, tagged with reference_topic
+    only when provided, and the uploaded file is removed afterwards.
+    """
+    try:
+        if web_results:
+            research_index.add_document(web_results, topic, source="web")
+        if reference_path:
+            reference_text = docx_read_tool_langgraph.invoke({"file_path": reference_path})
+            if not reference_text.startswith("Error"):
+                research_index.add_document(reference_text, reference_topic or "", source="reference_script")
+    except Exception as e:
+        # Indexing is best effort and must never fail the run
+        print(f"Error indexing run outputs: {e}")
+    finally:
+        remove_upload(reference_path)
+
+
+def schedule_indexing(*args):
+    """
+    Run index_run_outputs in a worker thread without blocking the event stream.
+    The task is owned by the event loop, so it completes even if the client disconnects.
+    """
+    task = asyncio.create_task(asyncio.to_thread(index_run_outputs, *args))
+    _indexing_tasks.add(task)
+    task.add_done_callback(_indexing_tasks.discard)
+
+
+async def stream_langgraph_task(
+    topic: str,
+    tones: list,
+    file_path: str,
+    platform: str,
+    index_reference: bool = False,
+    reference_topic: Optional[str] = None,
+):
     """
     Async generator that streams workflow progress and results as SSE-friendly events.
+    Uploaded reference scripts are only added to the research index when index_reference is set.
     """
+    cleanup_path = file_path
     yield {"status": "started"}
     try:
         state = await asyncio.to_thread(
@@ -28,6 +85,13 @@ async def stream_langgraph_task(topic: str, tones: list, file_path: str, platfor
         final_script = state.get("final_script", "No script generated")
         docx_path = create_script_docx(final_script, topic)
 
+        # Scheduled before the last event so it still runs if the client disconnects after it
+        reference_path = None
+        if index_reference and file_path and not is_builtin_template(file_path):
+            # The indexing task removes the upload once it has read it
+            reference_path, cleanup_path = file_path, None
+        schedule_indexing(topic, state.get("web_results", ""), reference_path, reference_topic)
+
         yield {
             "status": "completed",
             "final_script": final_script,
@@ -36,9 +100,4 @@ async def stream_langgraph_task(topic: str, tones: list, file_path: str, platfor
     except Exception as e:
         yield {"status": "failed", "error": str(e)}
     finally:
-        if file_path and file_path != "template_scripts/script-template-en.docx":
-            try:
-                os.remove(file_path)
-            except Exception:
-                # Silently ignore cleanup errors
-                pass
\ No newline at end of file
+        remove_upload(cleanup_path)
@@ -0,0 +1,30 @@
+from langchain_core.tools import tool
+from pydantic import BaseModel, Field
+from ..utils.research_index import research_index
+
+class ResearchIndexSearchInput(BaseModel):
+    """Input schema for searching the local research index."""
+    query: str = Field(..., description="Keywords describing the information to look up.")
+
+@tool("research_index_search_langgraph", args_schema=ResearchIndexSearchInput)
+def research_index_search_langgraph(query: str) -> str:
+    """
+    Searches the local index of past research results and reference scripts.
+    It answers in milliseconds, so use it before any web search and only search
+    the web for information that is missing here or too old given its indexing date.
+
+    Args:
+        query: Keywords describing the information to look up.
+    Returns:
+        The most relevant indexed passages with their topic and indexing date, or a message if nothing matches.
+    """
+    try:
+        results = research_index.search(query)
+    except Exception as e:
+        return f"Error searching research index: {str(e)}"
+    if not results:
+        return "No matching results in the local research index."
+    return "\n\n".join(
+        f"[{r['source']}] Topic: {r['topic'] or 'untagged'} | Indexed: {r['indexed_at']} (score {r['score']})\n{r['text']}"
+        for r in results
+    )
@@ -8,6 +8,11 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 import tempfile
 
 TEMP_DIR = Path(tempfile.gettempdir())
+BUILTIN_TEMPLATE_DIR = "template_scripts/"
+
+def is_builtin_template(file_path: str) -> bool:
+    """Return True if the path points at one of the bundled template scripts rather than an upload"""
+    return file_path.startswith(BUILTIN_TEMPLATE_DIR)
 
 def save_upload_file(upload_file: UploadFile) -> str:
     """Save the uploaded file to a temporary location and return the path"""
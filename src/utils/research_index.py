@@ -0,0 +1,207 @@
+import hashlib
+import os
+import re
+import sqlite3
+from contextlib import closing
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+# Must point at persistent, writable storage shared by all workers, otherwise past research is lost
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent.parent / "data" / "research_index.db"
+INDEX_PATH = Path(os.getenv("RESEARCH_INDEX_PATH") or DEFAULT_INDEX_PATH)
+
+# Oldest chunks are evicted once the index grows past this many chunks
+MAX_CHUNKS = int(os.getenv("RESEARCH_INDEX_MAX_CHUNKS") or 20000)
+
+CHUNK_WORDS = 200
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    chunk_hash TEXT UNIQUE NOT NULL,
+    topic TEXT NOT NULL,
+    source TEXT NOT NULL,
+    indexed_at TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(topic, text, content='chunks', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+    INSERT INTO chunks_fts(rowid, topic, text) VALUES (new.id, new.topic, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+    INSERT INTO chunks_fts(chunks_fts, rowid, topic, text) VALUES ('delete', old.id, old.topic, old.text);
+END;
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, ignoring single characters."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1]
+
+
+def chunk_text(text: str, max_words: int = CHUNK_WORDS) -> List[str]:
+    """
+    Split text into passages of at most max_words words, keeping paragraphs together.
+    Paragraphs longer than max_words are split into several passages.
+    """
+    chunks, current, count = [], [], 0
+    for paragraph in (p.strip() for p in text.split("\n")):
+        if not paragraph:
+            continue
+        words = paragraph.split()
+        if len(words) > max_words:
+            pieces = [" ".join(words[i:i + max_words]) for i in range(0, len(words), max_words)]
+        else:
+            pieces = [paragraph]
+        for piece in pieces:
+            piece_words = len(piece.split())
+            if current and count + piece_words > max_words:
+                chunks.append("\n".join(current))
+                current, count = [], 0
+            current.append(piece)
+            count += piece_words
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _is_corrupt(error: sqlite3.DatabaseError) -> bool:
+    # Corrupt or non-database files raise the base class; locks and schema errors use subclasses
+    return type(error) is sqlite3.DatabaseError
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _nearest_existing_dir(path: Path) -> Path:
+    for parent in path.parents:
+        if parent.exists():
+            return parent
+    return Path(".")
+
+
+class ResearchIndex:
+    """
+    On-disk BM25 index over past research results and reference scripts, backed by SQLite FTS5.
+
+    Each add only inserts the new chunks, and searches run against the database directly,
+    so neither grows slower with index size the way a full rewrite or reload would.
+    SQLite's own locking lets several worker processes share the file, and WAL mode keeps
+    searches running while another worker writes.
+    """
+
+    def __init__(self, path: Path = INDEX_PATH, max_chunks: int = MAX_CHUNKS):
+        self.path = Path(path)
+        self.max_chunks = max_chunks
+        self._corrupt_signature: Optional[tuple] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _move_aside(self):
+        """Move a corrupt database aside so the next connection starts a new one."""
+        print(f"Research index at {self.path} is corrupt, starting a new one")
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.replace(f"{self.path}{suffix}", f"{self.path}.corrupt{suffix}")
+            except OSError:
+                pass
+
+    def add_document(self, text: str, topic: str, source: str, indexed_at: Optional[str] = None) -> int:
+        """
+        Index the text of a document under the given source, tagged with the topic if one is given.
+        Returns the number of new chunks added; already indexed chunks are skipped.
+        """
+        indexed_at = indexed_at or date.today().isoformat()
+        rows = [
+            (hashlib.sha1(chunk.encode("utf-8")).hexdigest()[:16], topic, source, indexed_at, chunk)
+            for chunk in chunk_text(text)
+            if tokenize(chunk)
+        ]
+        if not rows:
+            return 0
+        try:
+            return self._insert(rows)
+        except sqlite3.DatabaseError as e:
+            if not _is_corrupt(e):
+                raise
+            self._move_aside()
+            self._corrupt_signature = None
+            return self._insert(rows)
+
+    def _insert(self, rows: List[tuple]) -> int:
+        with closing(self._connect()) as conn, conn:
+            added = conn.executemany(
+                "INSERT OR IGNORE INTO chunks (chunk_hash, topic, source, indexed_at, text) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            ).rowcount
+            if added:
+                conn.execute(
+                    "DELETE FROM chunks WHERE id IN (SELECT id FROM chunks ORDER BY id DESC LIMIT -1 OFFSET ?)",
+                    (self.max_chunks,),
+                )
+            return added
+
+    def __len__(self) -> int:
+        if not self.path.exists():
+            return 0
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def search(self, query: str, k: int = 3) -> List[dict]:
+        """Return the top k chunks for the query ranked by BM25 score."""
+        terms = sorted(set(tokenize(query)))
+        if not terms or not self.path.exists():
+            return []
+        signature = _file_signature(self.path)
+        if signature is not None and signature == self._corrupt_signature:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms)
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT c.topic, c.source, c.indexed_at, c.text, bm25(chunks_fts) AS rank
+                    FROM chunks_fts JOIN chunks c ON c.id = chunks_fts.rowid
+                    WHERE chunks_fts MATCH ?
+                    ORDER BY rank LIMIT ?
+                    """,
+                    (match, k),
+                ).fetchall()
+        except sqlite3.DatabaseError as e:
+            if not _is_corrupt(e):
+                raise
+            # Remember the bad file so searches do not retry it until a write replaces it
+            print(f"Research index at {self.path} is corrupt, ignoring it until the next add")
+            self._corrupt_signature = signature
+            return []
+        # FTS5 reports BM25 as a negative number where lower is better
+        return [
+            {"topic": topic, "source": source, "indexed_at": indexed_at, "text": text, "score": round(-rank, 3)}
+            for topic, source, indexed_at, text, rank in rows
+        ]
+
+
+def warn_if_not_writable(path: Path = INDEX_PATH):
+    """Warn at startup when the index cannot be written, e.g. inside a read-only serverless bundle."""
+    target = path.parent if path.parent.exists() else _nearest_existing_dir(path)
+    if not os.access(target, os.W_OK):
+        print(
+            f"Warning: research index directory {path.parent} is not writable, past research will not be "
+            "indexed. Set RESEARCH_INDEX_PATH to persistent, writable storage."
+        )
+
+
+warn_if_not_writable()
+research_index = ResearchIndex()
@@ -1,4 +1,5 @@
 from ..tools.docx_read_tool_langgraph import docx_read_tool_langgraph
+from ..tools.research_index_tool_langgraph import research_index_search_langgraph
 # from ..tools.notion_tool_langgraph import notion_create_page_langgraph
 from langchain_tavily import TavilySearch
 
@@ -6,7 +7,7 @@ tavily_tool = TavilySearch(max_results=2)
 
 def get_tools_for_agent(agent_key: str):
     if agent_key == 'researcher':
-        return [tavily_tool] if tavily_tool else []
+        return [research_index_search_langgraph] + ([tavily_tool] if tavily_tool else [])
     if agent_key == 'screenwriter':
         return [docx_read_tool_langgraph]
     return []
\ No newline at end of file
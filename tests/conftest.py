@@ -0,0 +1,4 @@
+import os
+
+# The Tavily tool is created at import time and refuses to start without a key
+os.environ.setdefault("TAVILY_API_KEY", "test")
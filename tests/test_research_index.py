@@ -0,0 +1,75 @@
+import os
+import pytest
+from src.utils.research_index import ResearchIndex, chunk_text, tokenize
+
+
+def test_tokenize_lowercases_and_drops_single_characters():
+    assert tokenize("Quantum Computing, a 2025 review!") == ["quantum", "computing", "2025", "review"]
+
+
+def test_chunk_text_keeps_short_paragraphs_together():
+    text = "one two three\n\nfour five\nsix seven eight"
+    assert chunk_text(text, max_words=5) == ["one two three\nfour five", "six seven eight"]
+
+
+def test_chunk_text_splits_long_paragraphs():
+    text = " ".join(f"w{i}" for i in range(25))
+    chunks = chunk_text(text, max_words=10)
+    assert [len(c.split()) for c in chunks] == [10, 10, 5]
+    assert " ".join(chunks) == text
+
+
+def test_add_document_skips_exact_duplicates(tmp_path):
+    index = ResearchIndex(tmp_path / "index.db")
+    text = "Qubits can be in superposition."
+    assert index.add_document(text, "quantum", "research") == 1
+    assert index.add_document(text, "quantum", "research") == 0
+    assert len(index) == 1
+
+
+def test_search_ranks_by_bm25_and_reports_indexed_date(tmp_path):
+    index = ResearchIndex(tmp_path / "index.db")
+    index.add_document("Qubits and superposition power quantum computers.", "quantum", "research", indexed_at="2025-01-02")
+    index.add_document("Cats sleep most of the day.", "cats", "research")
+    index.add_document("Superposition is also a principle in wave physics.", "", "reference_script")
+    results = index.search("qubits superposition")
+    assert [r["topic"] for r in results] == ["quantum", ""]
+    assert results[0]["indexed_at"] == "2025-01-02"
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_untagged_documents_do_not_match_on_topic(tmp_path):
+    index = ResearchIndex(tmp_path / "index.db")
+    index.add_document("An intro, three acts and an outro.", "", "reference_script")
+    assert index.search("quantum") == []
+
+
+def test_search_reloads_after_external_change(tmp_path):
+    path = tmp_path / "index.db"
+    reader = ResearchIndex(path)
+    assert reader.search("qubits") == []
+    ResearchIndex(path).add_document("Qubits can be in superposition.", "quantum", "research")
+    assert [r["topic"] for r in reader.search("qubits")] == ["quantum"]
+
+
+def test_old_chunks_are_evicted_past_the_cap(tmp_path):
+    index = ResearchIndex(tmp_path / "index.db", max_chunks=2)
+    for topic in ("alpha", "beta", "gamma"):
+        index.add_document(f"Notes about {topic}.", topic, "web")
+    assert len(index) == 2
+    assert index.search("alpha") == []
+    assert [r["topic"] for r in index.search("gamma")] == ["gamma"]
+
+
+@pytest.mark.parametrize("content", [b'{"chunks": {', b"\xff\xfe\x00garbage" * 100], ids=["truncated", "binary"])
+def test_corrupt_index_is_rebuilt(tmp_path, capsys, content):
+    path = tmp_path / "index.db"
+    path.write_bytes(content)
+    index = ResearchIndex(path)
+    assert index.search("qubits") == []
+    assert index.search("qubits") == []
+    # The bad file is only parsed and reported once until it changes
+    assert capsys.readouterr().out.count("is corrupt") == 1
+    assert index.add_document("Qubits can be in superposition.", "quantum", "research") == 1
+    assert os.path.exists(str(path) + ".corrupt")
+    assert [r["topic"] for r in ResearchIndex(path).search("qubits")] == ["quantum"]
@@ -0,0 +1,33 @@
+import json
+from langchain_core.messages import AIMessage, ToolMessage
+from src.nodes.research import collect_web_results
+from src.tools import research_index_tool_langgraph
+from src.utils.research_index import ResearchIndex
+
+
+def test_tool_output_shows_source_topic_and_indexed_date(monkeypatch, tmp_path):
+    index = ResearchIndex(tmp_path / "index.db")
+    index.add_document("Qubits can be in superposition.", "quantum", "web", indexed_at="2025-03-04")
+    index.add_document("Qubits in a reference script.", "", "reference_script", indexed_at="2025-05-06")
+    monkeypatch.setattr(research_index_tool_langgraph, "research_index", index)
+    output = research_index_tool_langgraph.research_index_search_langgraph.invoke({"query": "qubits superposition"})
+    first, second = output.split("\n\n")
+    assert first.startswith("[web] Topic: quantum | Indexed: 2025-03-04 (score ")
+    assert first.endswith("\nQubits can be in superposition.")
+    assert second.startswith("[reference_script] Topic: untagged | Indexed: 2025-05-06 (score ")
+
+
+def test_tool_reports_no_matches(monkeypatch, tmp_path):
+    monkeypatch.setattr(research_index_tool_langgraph, "research_index", ResearchIndex(tmp_path / "index.db"))
+    output = research_index_tool_langgraph.research_index_search_langgraph.invoke({"query": "qubits"})
+    assert output == "No matching results in the local research index."
+
+
+def test_collect_web_results_keeps_only_tavily_results():
+    results = {"results": [{"title": "Qubits", "url": "https://example.com", "content": "Qubits can be in superposition."}]}
+    messages = [
+        ToolMessage(content=json.dumps(results), name="tavily_search", tool_call_id="1"),
+        ToolMessage(content="Indexed passage", name="research_index_search_langgraph", tool_call_id="2"),
+        AIMessage(content="Summary of the research"),
+    ]
+    assert collect_web_results(messages) == "Qubits (https://example.com)\nQubits can be in superposition."
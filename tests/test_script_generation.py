@@ -0,0 +1,115 @@
+import asyncio
+import docx
+import pytest
+from src.services import script_generation
+
+
+class FakeIndex:
+    def __init__(self):
+        self.added = []
+
+    def add_document(self, text, topic, source, indexed_at=None):
+        self.added.append({"text": text, "topic": topic, "source": source})
+        return 1
+
+
+@pytest.fixture
+def fake_index(monkeypatch):
+    index = FakeIndex()
+    monkeypatch.setattr(script_generation, "research_index", index)
+    monkeypatch.setattr(script_generation, "create_script_docx", lambda script, topic: "script.docx")
+    return index
+
+
+@pytest.fixture
+def removed(monkeypatch):
+    calls = []
+    real_remove = script_generation.os.remove
+
+    def remove(path):
+        calls.append(path)
+        real_remove(path)
+
+    monkeypatch.setattr(script_generation.os, "remove", remove)
+    return calls
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "upload.docx"
+    document = docx.Document()
+    document.add_paragraph("Hook, three acts and a call to action.")
+    document.save(path)
+    return str(path)
+
+
+def fake_workflow(monkeypatch, web_results="Qubits (https://example.com)\nQubits can be in superposition."):
+    def run(**kwargs):
+        return {"research_results": "Summary of the research", "web_results": web_results, "final_script": "Script"}
+    monkeypatch.setattr(script_generation, "run_youtube_script_workflow", run)
+
+
+def run_stream(stop_after=None, **kwargs):
+    """Consume the event stream, optionally disconnecting after a status, then wait for indexing."""
+    async def consume():
+        events = []
+        stream = script_generation.stream_langgraph_task(tones=["fun"], platform="YouTube", **kwargs)
+        async for event in stream:
+            events.append(event)
+            if event["status"] == stop_after:
+                await stream.aclose()
+                break
+        await asyncio.gather(*list(script_generation._indexing_tasks))
+        return events
+    return asyncio.run(consume())
+
+
+def test_only_web_results_are_indexed_and_upload_is_kept_out(monkeypatch, fake_index, removed, upload):
+    fake_workflow(monkeypatch)
+    events = run_stream(topic="quantum", file_path=upload)
+    assert events[-1]["status"] == "completed"
+    assert [(a["topic"], a["source"]) for a in fake_index.added] == [("quantum", "web")]
+    assert "Summary of the research" not in fake_index.added[0]["text"]
+    assert removed == [upload]
+
+
+def test_empty_web_results_are_not_indexed(monkeypatch, fake_index, removed, upload):
+    fake_workflow(monkeypatch, web_results="")
+    run_stream(topic="quantum", file_path=upload)
+    assert fake_index.added == []
+    assert removed == [upload]
+
+
+@pytest.mark.parametrize("reference_topic,expected_topic", [(None, ""), ("storytelling", "storytelling")])
+def test_opted_in_upload_is_indexed_then_removed_once(monkeypatch, fake_index, removed, upload, reference_topic, expected_topic):
+    fake_workflow(monkeypatch, web_results="")
+    run_stream(topic="quantum", file_path=upload, index_reference=True, reference_topic=reference_topic)
+    assert fake_index.added == [
+        {"text": "Hook, three acts and a call to action.", "topic": expected_topic, "source": "reference_script"}
+    ]
+    assert removed == [upload]
+
+
+def test_indexing_completes_after_client_disconnects(monkeypatch, fake_index, removed, upload):
+    fake_workflow(monkeypatch)
+    events = run_stream(stop_after="completed", topic="quantum", file_path=upload, index_reference=True)
+    assert events[-1]["status"] == "completed"
+    assert [a["source"] for a in fake_index.added] == ["web", "reference_script"]
+    assert removed == [upload]
+
+
+def test_builtin_template_is_never_indexed_or_removed(monkeypatch, fake_index, removed):
+    fake_workflow(monkeypatch, web_results="")
+    run_stream(topic="quantum", file_path="template_scripts/script-template-en.docx", index_reference=True)
+    assert fake_index.added == []
+    assert removed == []
+
+
+def test_failed_run_removes_upload_without_indexing(monkeypatch, fake_index, removed, upload):
+    def run(**kwargs):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(script_generation, "run_youtube_script_workflow", run)
+    events = run_stream(topic="quantum", file_path=upload, index_reference=True)
+    assert events[-1] == {"status": "failed", "error": "boom"}
+    assert fake_index.added == []
+    assert removed == [upload]